@@ -1,16 +1,22 @@
 """Simple task management package."""
 
-from .manager import TaskManager
-from .models import Task
-from .savings import (
-    CategoryPreset,
-    DailySummary,
-    InstantFeedback,
-    RewardGoal,
-    RewardProgress,
-    SavingsDietTracker,
-)
-from .storage import TaskStorage
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .manager import TaskManager
+    from .models import Task
+    from .savings import (
+        CategoryPreset,
+        DailySummary,
+        InstantFeedback,
+        RewardGoal,
+        RewardProgress,
+        SavingsDietTracker,
+    )
+    from .storage import TaskStorage
 
 __all__ = [
     "TaskManager",
@@ -23,3 +29,30 @@ __all__ = [
     "RewardProgress",
     "SavingsDietTracker",
 ]
+
+# Re-exports are resolved on first access (PEP 562) so that ``python -m
+# task_manager`` does not import modules the CLI never uses.
+_EXPORTS = {
+    "TaskManager": ".manager",
+    "TaskStorage": ".storage",
+    "Task": ".models",
+    "CategoryPreset": ".savings",
+    "InstantFeedback": ".savings",
+    "DailySummary": ".savings",
+    "RewardGoal": ".savings",
+    "RewardProgress": ".savings",
+    "SavingsDietTracker": ".savings",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import sys
+from itertools import chain
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -22,7 +24,9 @@ def create_storage(path: Optional[str] = None) -> TaskStorage:
     return TaskStorage(Path(path))
 
 
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    """Return the CLI parser, built once and reused by every ``main`` call."""
     parser = argparse.ArgumentParser(description="シンプルなタスク管理ツール")
     parser.add_argument(
         "--database",
@@ -118,16 +122,40 @@ def format_detailed(task: Task) -> str:
 def _render_table(headers: List[str], rows: List[List[str]]) -> str:
     if not rows:
         return "登録済みのタスクはありません。"
-    widths = [len(header) for header in headers]
-    for row in rows:
-        for index, cell in enumerate(row):
-            widths[index] = max(widths[index], len(cell))
-    header_line = " | ".join(header.ljust(widths[i]) for i, header in enumerate(headers))
-    separator = "-+-".join("-" * width for width in widths)
-    row_lines = [
-        " | ".join(cell.ljust(widths[i]) for i, cell in enumerate(row)) for row in rows
+    widths = [
+        max(len(header), *map(len, column)) for header, column in zip(headers, zip(*rows))
     ]
-    return "\n".join([header_line, separator, *row_lines])
+    # One left-aligned format spec per column, applied to every row in a single
+    # ``str.format`` call instead of an ``ljust`` call per cell.
+    line_format = " | ".join(f"{{:<{width}}}" for width in widths)
+    separator = "-+-".join("-" * width for width in widths)
+    body = "\n".join([line_format] * len(rows)).format(*chain.from_iterable(rows))
+    return "\n".join([line_format.format(*headers), separator, body])
+
+
+def _write_stdout(text: str) -> None:
+    """Write ``text`` to stdout, bypassing the text layer when possible.
+
+    Large listings are encoded once and written straight to the file
+    descriptor. Streams without a usable descriptor (captured or replaced
+    stdout) go through ``sys.stdout.write`` instead, as does everything on
+    Windows: consoles need the text layer to render Unicode, and files and
+    pipes need its ``\n`` to CRLF translation to match ``print`` output.
+    """
+    stream = sys.stdout
+    if os.name == "nt":
+        stream.write(text)
+        return
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        stream.write(text)
+        return
+    stream.flush()
+    payload = memoryview(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+    while payload:
+        written = os.write(fd, payload)
+        payload = payload[written:]
 
 
 def command_add(manager: TaskManager, args: argparse.Namespace) -> None:
@@ -143,13 +171,13 @@ def command_add(manager: TaskManager, args: argparse.Namespace) -> None:
 def command_list(manager: TaskManager, args: argparse.Namespace) -> None:
     status = None if args.status == "all" else args.status
     tasks = manager.list_tasks(status=status)
-    if args.detailed:
-        if not tasks:
-            print("登録済みのタスクはありません。")
-            return
-        print("\n\n".join(format_detailed(task) for task in tasks))
+    if not args.detailed:
+        output = format_tasks(tasks)
+    elif not tasks:
+        output = "登録済みのタスクはありません。"
     else:
-        print(format_tasks(tasks))
+        output = "\n\n".join([format_detailed(task) for task in tasks])
+    _write_stdout(output + "\n")
 
 
 def command_complete(manager: TaskManager, args: argparse.Namespace) -> None:
@@ -181,21 +209,22 @@ def command_delete(manager: TaskManager, args: argparse.Namespace) -> None:
     print(f"タスク {args.task_id} を削除しました。")
 
 
+COMMANDS = {
+    "add": command_add,
+    "list": command_list,
+    "complete": command_complete,
+    "update": command_update,
+    "delete": command_delete,
+}
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
     storage = create_storage(args.database)
     manager = TaskManager(storage)
 
-    commands = {
-        "add": command_add,
-        "list": command_list,
-        "complete": command_complete,
-        "update": command_update,
-        "delete": command_delete,
-    }
-
-    command = commands.get(args.command)
+    command = COMMANDS.get(args.command)
     if command is None:
         parser.error("不明なコマンドです。")
         return 2
@@ -2,23 +2,52 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable, List, Optional
+import bisect
+import copy
+import os
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
 from .models import Task
 from .storage import TaskStorage
 
 
+def _fast_parse_ymd(value: str) -> Optional[date]:
+    """Parse a zero padded ``YYYY-MM-DD`` string without ``strptime``.
+
+    Returns ``None`` when the value does not have exactly that shape so the
+    caller can fall back to the slower, more lenient parser.
+    """
+    if len(value) != 10 or value[4] != "-" or value[7] != "-" or not value.isascii():
+        return None
+    year, month, day = value[:4], value[5:7], value[8:]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _sort_key(task: Task) -> Tuple[bool, str, int]:
+    return task.completed, task.due_date or "9999-12-31", task.id
+
+
 class TaskManager:
     """High level API used by the CLI to manage tasks."""
 
     PRIORITY_LEVELS = ("low", "normal", "high")
+    _PRIORITY_SET = frozenset(PRIORITY_LEVELS)
 
     def __init__(self, storage: TaskStorage) -> None:
         self.storage = storage
+        self._cache: Optional[List[Task]] = None
+        self._cache_stat: Optional[Tuple[int, int]] = None
+        self._max_id = 0
 
     def _validate_priority(self, priority: str) -> str:
-        if priority not in self.PRIORITY_LEVELS:
+        if priority not in self._PRIORITY_SET:
             raise ValueError(
                 f"優先度は {', '.join(self.PRIORITY_LEVELS)} のいずれかを指定してください。"
             )
@@ -27,17 +56,58 @@ class TaskManager:
     def _normalise_due_date(self, due_date: Optional[str]) -> Optional[str]:
         if due_date in (None, ""):
             return None
+        fast = _fast_parse_ymd(due_date)
+        if fast is not None:
+            return fast.isoformat()
         try:
             parsed = datetime.strptime(due_date, "%Y-%m-%d")
         except ValueError as exc:
             raise ValueError("期限は YYYY-MM-DD 形式で指定してください。") from exc
         return parsed.date().isoformat()
 
-    def _load(self) -> List[Task]:
-        return self.storage.load_tasks()
-
-    def _save(self, tasks: Iterable[Task]) -> None:
-        self.storage.save_tasks(tasks)
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.storage.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _fill_cache(self, tasks: List[Task], stat: Optional[Tuple[int, int]]) -> None:
+        self._cache = tasks
+        self._cache_stat = stat
+        self._max_id = max((task.id for task in tasks), default=0)
+
+    def _cached_tasks(self) -> List[Task]:
+        """Return the cached tasks in display order, reloading if stale.
+
+        The returned objects belong to the cache and must not be handed out.
+        """
+        # The parsed tasks are cached until the file's mtime or size changes,
+        # so back-to-back operations in one process only parse the file once.
+        stat = self._stat()
+        # A missing file is not cached: the storage may hold saves that a
+        # ``TaskStorage.batch`` block has not written yet.
+        if self._cache is None or stat is None or stat != self._cache_stat:
+            loaded = self.storage.load_tasks()
+            # Files written by this class are already sorted, making this a
+            # linear pass; older or hand-edited files get ordered once here.
+            loaded.sort(key=_sort_key)
+            self._fill_cache(loaded, stat)
+        return self._cache
+
+    def _load(self) -> Dict[int, Task]:
+        """Return copies of the stored tasks keyed by ID, in display order."""
+        return {task.id: copy.copy(task) for task in self._cached_tasks()}
+
+    def _save(self, tasks: Dict[int, Task]) -> None:
+        # Persist in display order so list_tasks never has to sort.
+        ordered = sorted(tasks.values(), key=_sort_key)
+        self.storage.save_tasks(ordered)
+        # A save deferred by ``TaskStorage.batch`` is not on disk yet, so it must
+        # not be cached under the file's current stat; leaving the stat unset
+        # makes the next load ask the storage again.
+        stat = None if self.storage.has_pending else self._stat()
+        self._fill_cache([copy.copy(task) for task in ordered], stat)
 
     def add_task(
         self,
@@ -50,7 +120,7 @@ class TaskManager:
         tasks = self._load()
         due = self._normalise_due_date(due_date)
         priority_value = self._validate_priority(priority)
-        next_id = max((task.id for task in tasks), default=0) + 1
+        next_id = self._max_id + 1
         new_task = Task(
             id=next_id,
             title=title,
@@ -58,30 +128,25 @@ class TaskManager:
             due_date=due,
             priority=priority_value,
         )
-        tasks.append(new_task)
+        tasks[next_id] = new_task
         self._save(tasks)
         return new_task
 
     def list_tasks(self, *, status: Optional[str] = None) -> List[Task]:
-        tasks = self._load()
-        if status == "pending":
-            tasks = [task for task in tasks if not task.completed]
-        elif status == "completed":
-            tasks = [task for task in tasks if task.completed]
-        return sorted(
-            tasks,
-            key=lambda task: (
-                task.completed,
-                task.due_date or "9999-12-31",
-                task.id,
-            ),
-        )
-
-    def _find_task(self, task_id: int, tasks: List[Task]) -> Task:
-        for task in tasks:
-            if task.id == task_id:
-                return task
-        raise ValueError(f"ID {task_id} のタスクが見つかりません。")
+        # The cache is in display order, so pending and completed tasks form two
+        # contiguous runs; a binary search finds the boundary without a scan and
+        # only the returned slice is copied.
+        tasks = self._cached_tasks()
+        if status in ("pending", "completed"):
+            boundary = bisect.bisect_left(tasks, True, key=attrgetter("completed"))
+            tasks = tasks[:boundary] if status == "pending" else tasks[boundary:]
+        return [copy.copy(task) for task in tasks]
+
+    def _find_task(self, task_id: int, tasks: Dict[int, Task]) -> Task:
+        task = tasks.get(task_id)
+        if task is None:
+            raise ValueError(f"ID {task_id} のタスクが見つかりません。")
+        return task
 
     def update_task(
         self,
@@ -114,6 +179,6 @@ class TaskManager:
 
     def delete_task(self, task_id: int) -> None:
         tasks = self._load()
-        task = self._find_task(task_id, tasks)
-        tasks.remove(task)
+        self._find_task(task_id, tasks)
+        del tasks[task_id]
         self._save(tasks)
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+# (epoch second, formatted timestamp) of the last call; the format only has
+# second resolution, so calls within the same second can reuse the string.
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
 
 def current_timestamp() -> str:
     """Return the current UTC timestamp formatted for storage."""
-    return datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        formatted = datetime.fromtimestamp(second, timezone.utc).strftime(TIMESTAMP_FORMAT)
+        _timestamp_cache = (second, formatted)
+    return _timestamp_cache[1]
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Representation of a single task item."""
 
@@ -29,21 +39,37 @@ class Task:
 
     def to_dict(self) -> Dict[str, Any]:
         """Return a JSON serialisable representation of the task."""
-        return asdict(self)
+        # Spelled out rather than ``asdict`` which deep-copies every field.
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "due_date": self.due_date,
+            "priority": self.priority,
+            "completed": self.completed,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Task":
         """Create a task instance from stored JSON data."""
-        defaults = {
-            "description": "",
-            "due_date": None,
-            "priority": "normal",
-            "completed": False,
-            "created_at": current_timestamp(),
-            "updated_at": current_timestamp(),
-        }
-        merged: Dict[str, Any] = {**defaults, **data}
-        return cls(**merged)
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
+        if created_at is None or updated_at is None:
+            now = current_timestamp()
+            created_at = now if created_at is None else created_at
+            updated_at = now if updated_at is None else updated_at
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data.get("description", ""),
+            due_date=data.get("due_date"),
+            priority=data.get("priority", "normal"),
+            completed=data.get("completed", False),
+            created_at=created_at,
+            updated_at=updated_at,
+        )
 
     def mark_completed(self, completed: bool = True) -> None:
         """Toggle the completion state and update the timestamp."""
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
-from typing import Dict, Iterable, List, Optional, Sequence
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import calendar
 import math
 
+_UTC = timezone.utc
+_MIDNIGHT = datetime.min.time()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CategoryPreset:
     """Represents a purchasable item that users might resist buying."""
 
@@ -22,12 +27,17 @@ class CategoryPreset:
         return self.price, self.calories
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RestraintRecord:
     """Single restraint action recorded by the tracker."""
 
     category: CategoryPreset
     timestamp: datetime
+    utc_date: date = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Derived once here so aggregations never repeat the tz conversion.
+        object.__setattr__(self, "utc_date", self.timestamp.astimezone(_UTC).date())
 
     @property
     def saved_amount(self) -> float:
@@ -38,7 +48,7 @@ class RestraintRecord:
         return self.category.calories
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstantFeedback:
     """Information returned after a restraint has been logged."""
 
@@ -48,7 +58,7 @@ class InstantFeedback:
     total_calories: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailySummary:
     """Aggregated savings and calories for a single day."""
 
@@ -57,7 +67,7 @@ class DailySummary:
     calories_reduced: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RewardGoal:
     """User defined goal that converts savings into a reward."""
 
@@ -65,7 +75,7 @@ class RewardGoal:
     target_amount: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RewardProgress:
     """Progress information for a configured reward goal."""
 
@@ -75,6 +85,22 @@ class RewardProgress:
     estimated_actions: Optional[int]
 
 
+class _CompensatedSum:
+    """Running float sum using Kahan compensation to bound round-off."""
+
+    __slots__ = ("total", "_compensation")
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self._compensation = 0.0
+
+    def add(self, value: float) -> None:
+        adjusted = value - self._compensation
+        new_total = self.total + adjusted
+        self._compensation = (new_total - self.total) - adjusted
+        self.total = new_total
+
+
 class SavingsDietTracker:
     """Core domain service for the savings x diet prototype."""
 
@@ -89,14 +115,21 @@ class SavingsDietTracker:
         self._categories: Dict[str, CategoryPreset] = {preset.name: preset for preset in presets}
         if not self._categories:
             raise ValueError("カテゴリが1つ以上必要です。")
+        # Live read-only view; it follows add_category without being rebuilt.
+        self._categories_view = MappingProxyType(self._categories)
         self._records: List[RestraintRecord] = []
+        # Records grouped by the (year, month) of their UTC date.
+        self._records_by_month: Dict[Tuple[int, int], List[RestraintRecord]] = {}
         self._reward_goal: Optional[RewardGoal] = None
+        # Running totals so feedback and progress never re-walk the records.
+        self._total_saved = _CompensatedSum()
+        self._total_calories = _CompensatedSum()
 
     @property
-    def categories(self) -> Dict[str, CategoryPreset]:
-        """Return a mapping of available preset categories."""
+    def categories(self) -> Mapping[str, CategoryPreset]:
+        """Return a read-only mapping of available preset categories."""
 
-        return dict(self._categories)
+        return self._categories_view
 
     def add_category(self, preset: CategoryPreset) -> None:
         """Register an additional preset category."""
@@ -114,42 +147,84 @@ class SavingsDietTracker:
         if category_name not in self._categories:
             raise ValueError(f"カテゴリ '{category_name}' は登録されていません。")
         category = self._categories[category_name]
-        timestamp = self._normalise_timestamp(when)
-        record = RestraintRecord(category=category, timestamp=timestamp)
-        self._records.append(record)
+        self._append_record(category, self._normalise_timestamp(when))
 
-        total_saved, total_calories = self._totals()
         saved, calories = category.feedback()
         return InstantFeedback(
             saved_amount=saved,
             calories_reduced=calories,
-            total_saved=total_saved,
-            total_calories=total_calories,
+            total_saved=self._total_saved.total,
+            total_calories=self._total_calories.total,
         )
 
+    def register_restraint_bulk(
+        self,
+        category_names: Sequence[str],
+        *,
+        whens: Optional[Sequence[Optional[datetime | date | str]]] = None,
+    ) -> InstantFeedback:
+        """Register several restraints at once.
+
+        Every name and timestamp is validated before anything is recorded, so an
+        invalid entry leaves the tracker unchanged. The returned feedback holds
+        the amounts of the whole batch.
+        """
+
+        categories = self._categories
+        for name in category_names:
+            if name not in categories:
+                raise ValueError(f"カテゴリ '{name}' は登録されていません。")
+        if whens is None:
+            # One shared "now" for the batch instead of a clock read per item.
+            timestamps = [datetime.now(_UTC)] * len(category_names)
+        elif len(whens) != len(category_names):
+            raise ValueError("whens は category_names と同じ件数で指定してください。")
+        else:
+            timestamps = [self._normalise_timestamp(when) for when in whens]
+
+        saved = _CompensatedSum()
+        calories = _CompensatedSum()
+        for name, timestamp in zip(category_names, timestamps):
+            category = categories[name]
+            self._append_record(category, timestamp)
+            saved.add(category.price)
+            calories.add(category.calories)
+        return InstantFeedback(
+            saved_amount=saved.total,
+            calories_reduced=calories.total,
+            total_saved=self._total_saved.total,
+            total_calories=self._total_calories.total,
+        )
+
+    def _append_record(self, category: CategoryPreset, timestamp: datetime) -> None:
+        record = RestraintRecord(category=category, timestamp=timestamp)
+        self._records.append(record)
+        month_key = (record.utc_date.year, record.utc_date.month)
+        self._records_by_month.setdefault(month_key, []).append(record)
+        self._total_saved.add(category.price)
+        self._total_calories.add(category.calories)
+
     def _normalise_timestamp(
         self, when: Optional[datetime | date | str]
     ) -> datetime:
         if when is None:
-            return datetime.now(timezone.utc)
+            return datetime.now(_UTC)
         if isinstance(when, datetime):
-            return when if when.tzinfo is not None else when.replace(tzinfo=timezone.utc)
+            return when if when.tzinfo is not None else when.replace(tzinfo=_UTC)
         if isinstance(when, date):
-            return datetime.combine(when, datetime.min.time(), tzinfo=timezone.utc)
+            return datetime.combine(when, _MIDNIGHT, tzinfo=_UTC)
         if isinstance(when, str):
             try:
                 parsed = datetime.fromisoformat(when)
             except ValueError as exc:
                 raise ValueError("when は ISO 8601 形式で指定してください。") from exc
             if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
+                parsed = parsed.replace(tzinfo=_UTC)
             return parsed
         raise TypeError("when には datetime, date, str, None のいずれかを指定してください。")
 
     def _totals(self) -> tuple[float, float]:
-        total_saved = sum(record.saved_amount for record in self._records)
-        total_calories = sum(record.calories_reduced for record in self._records)
-        return total_saved, total_calories
+        return self._total_saved.total, self._total_calories.total
 
     def totals(self) -> InstantFeedback:
         """Return the cumulative savings and calories."""
@@ -165,22 +240,28 @@ class SavingsDietTracker:
     def monthly_breakdown(self, year: int, month: int) -> List[DailySummary]:
         """Aggregate savings and calories per day for the requested month."""
 
-        aggregates: Dict[date, DailySummary] = {}
-        for record in self._records:
-            record_date = record.timestamp.astimezone(timezone.utc).date()
-            if record_date.year != year or record_date.month != month:
-                continue
-            if record_date not in aggregates:
-                aggregates[record_date] = DailySummary(
-                    date=record_date, saved_amount=0.0, calories_reduced=0.0
-                )
-            summary = aggregates[record_date]
-            aggregates[record_date] = DailySummary(
-                date=summary.date,
-                saved_amount=summary.saved_amount + record.saved_amount,
-                calories_reduced=summary.calories_reduced + record.calories_reduced,
+        if not 1 <= month <= 12:
+            raise ValueError("月は 1 から 12 の範囲で指定してください。")
+        # Only the requested month's records are visited; they are accumulated
+        # into one bin per day and summaries are built once at the end.
+        days_in_month = calendar.monthrange(year, month)[1]
+        saved = [0.0] * days_in_month
+        calories = [0.0] * days_in_month
+        counts = [0] * days_in_month
+        for record in self._records_by_month.get((year, month), ()):
+            offset = record.utc_date.day - 1
+            saved[offset] += record.saved_amount
+            calories[offset] += record.calories_reduced
+            counts[offset] += 1
+        return [
+            DailySummary(
+                date=date(year, month, offset + 1),
+                saved_amount=saved[offset],
+                calories_reduced=calories[offset],
             )
-        return [aggregates[key] for key in sorted(aggregates)]
+            for offset in range(days_in_month)
+            if counts[offset]
+        ]
 
     def set_reward_goal(
         self,
@@ -209,12 +290,18 @@ class SavingsDietTracker:
                 raise ValueError(f"カテゴリ '{reference_category}' は登録されていません。")
             per_action_value = self._categories[reference_category].price
         elif self._records:
-            per_action_value = (
-                sum(record.saved_amount for record in self._records) / len(self._records)
-            )
+            per_action_value = current_saved / len(self._records)
 
         if per_action_value and per_action_value > 0:
-            estimated_actions = math.ceil(remaining / per_action_value) if remaining else 0
+            # Dividing floats can land just above an exact multiple (0.07 / 0.01
+            # is 7.000000000000001), so quotients within a few ULPs of an integer
+            # are taken as that integer rather than ceiled to the next one.
+            quotient = remaining / per_action_value
+            nearest = round(quotient)
+            if abs(quotient - nearest) <= 4 * math.ulp(quotient):
+                estimated_actions = nearest
+            else:
+                estimated_actions = math.ceil(quotient)
         else:
             estimated_actions = None
 
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from .models import Task
 
+try:  # orjson is an optional accelerator; the stdlib codec is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 
 class TaskStorage:
     """Persist tasks to a JSON file on disk."""
@@ -15,17 +23,98 @@ class TaskStorage:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_depth = 0
+        # Serialised tasks saved inside a ``batch`` block but not yet written.
+        self._pending: Optional[List[Dict[str, Any]]] = None
 
     def load_tasks(self) -> List[Task]:
-        """Load all stored tasks."""
+        """Load all stored tasks, including saves still pending in a batch."""
+        if self._pending is not None:
+            return [Task.from_dict(item) for item in self._pending]
         if not self.path.exists():
             return []
-        with self.path.open("r", encoding="utf-8") as handle:
-            raw_tasks = json.load(handle)
-        return [Task.from_dict(item) for item in raw_tasks]
+        if orjson is not None:
+            raw_tasks = orjson.loads(self.path.read_bytes())
+        else:
+            with self.path.open("r", encoding="utf-8") as handle:
+                raw_tasks = json.load(handle)
+        if not isinstance(raw_tasks, list):
+            raw_tasks = list(raw_tasks)
+        # Replace each decoded dict with its Task in place, so the dicts are
+        # freed one by one instead of a full second list being built.
+        for index, item in enumerate(raw_tasks):
+            raw_tasks[index] = Task.from_dict(item)
+        return raw_tasks
 
     def save_tasks(self, tasks: Iterable[Task]) -> None:
-        """Persist the given tasks list."""
+        """Persist the given tasks list.
+
+        Inside a ``batch`` block the write is deferred until the block exits.
+        """
         serialisable = [task.to_dict() for task in tasks]
-        with self.path.open("w", encoding="utf-8") as handle:
-            json.dump(serialisable, handle, ensure_ascii=False, indent=2)
+        if self._batch_depth:
+            self._pending = serialisable
+            return
+        self._write(serialisable)
+        # Supersedes any batch snapshot left behind by a failed flush.
+        self._pending = None
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether saved tasks are waiting to be written to the file."""
+        return self._pending is not None
+
+    def flush_pending(self) -> None:
+        """Write tasks saved during a ``batch`` block, if any.
+
+        If the write fails the snapshot is kept, so ``load_tasks`` keeps
+        returning it and the next flush or successful save writes it out.
+        """
+        if self._pending is not None:
+            self._write(self._pending)
+            self._pending = None
+
+    @contextmanager
+    def batch(self) -> Iterator[TaskStorage]:
+        """Coalesce every save made inside the block into a single file write.
+
+        Blocks may be nested; the data is written when the outermost one exits,
+        also when it exits with an exception, since each save has already been
+        reported to the caller as done.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush_pending()
+
+    def _write(self, serialisable: List[Dict[str, Any]]) -> None:
+        # The data is written to a temporary file next to the database which
+        # then atomically replaces it, so a crash mid-write never leaves a
+        # truncated JSON file behind.
+        if orjson is not None:
+            payload = orjson.dumps(serialisable, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(serialisable, ensure_ascii=False, indent=2).encode("utf-8")
+        # A unique name per save keeps concurrent writers from truncating each
+        # other's temporary file right before it is swapped in.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            try:
+                # mkstemp creates the file owner-only; keep the database's mode.
+                os.chmod(tmp_path, self.path.stat().st_mode & 0o777)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
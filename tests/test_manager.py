@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
+from task_manager import storage as storage_module
+from task_manager.cli import main
 from task_manager.manager import TaskManager
 from task_manager.storage import TaskStorage
 
@@ -87,3 +92,200 @@ def test_storage_persists_data(tmp_path: Path) -> None:
     raw = read_raw_tasks(storage_path)
     assert raw[0]["title"] == "掃除"
     assert raw[0]["description"] == "玄関"
+
+
+def test_storage_replaces_file_atomically(tmp_path: Path) -> None:
+    storage_path = tmp_path / "tasks.json"
+    manager = TaskManager(TaskStorage(storage_path))
+    manager.add_task(title="掃除")
+    manager.add_task(title="洗濯")
+    assert [item["title"] for item in read_raw_tasks(storage_path)] == ["掃除", "洗濯"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["tasks.json"]
+
+
+def test_due_date_is_normalised(manager: TaskManager) -> None:
+    assert manager.add_task(title="通院", due_date="2024-3-5").due_date == "2024-03-05"
+    assert manager.add_task(title="旅行", due_date="2024-02-29").due_date == "2024-02-29"
+    with pytest.raises(ValueError):
+        manager.add_task(title="存在しない日", due_date="2023-02-29")
+
+
+def test_cache_sees_changes_from_other_instances(tmp_path: Path) -> None:
+    storage_path = tmp_path / "tasks.json"
+    writer = TaskManager(TaskStorage(storage_path))
+    reader = TaskManager(TaskStorage(storage_path))
+    writer.add_task(title="読書")
+    assert [task.title for task in reader.list_tasks()] == ["読書"]
+    writer.add_task(title="ジョギング")
+    assert [task.title for task in reader.list_tasks()] == ["読書", "ジョギング"]
+    storage_path.unlink()
+    assert reader.list_tasks() == []
+
+
+def test_returned_tasks_are_detached_from_cache(manager: TaskManager) -> None:
+    task = manager.add_task(title="料理")
+    task.title = "保存されない変更"
+    manager.list_tasks()[0].completed = True
+    stored = manager.list_tasks()[0]
+    assert stored.title == "料理"
+    assert not stored.completed
+
+
+def test_storage_without_orjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(storage_module, "orjson", None)
+    storage_path = tmp_path / "tasks.json"
+    manager = TaskManager(TaskStorage(storage_path))
+    manager.add_task(title="請求書", due_date="2024-05-01")
+    assert read_raw_tasks(storage_path)[0]["title"] == "請求書"
+    loaded = TaskStorage(storage_path).load_tasks()
+    assert loaded[0].title == "請求書"
+    assert loaded[0].due_date == "2024-05-01"
+
+
+def test_tasks_are_stored_in_display_order(manager: TaskManager, tmp_path: Path) -> None:
+    first = manager.add_task(title="後で", due_date="2024-06-01")
+    manager.add_task(title="先に", due_date="2024-05-01")
+    manager.add_task(title="期限なし")
+    manager.complete_task(first.id)
+    expected = ["先に", "期限なし", "後で"]
+    assert [item["title"] for item in read_raw_tasks(tmp_path / "tasks.json")] == expected
+    assert [task.title for task in manager.list_tasks()] == expected
+
+
+def test_list_sorts_unordered_files(tmp_path: Path) -> None:
+    storage_path = tmp_path / "tasks.json"
+    raw = [
+        {"id": 1, "title": "完了済み", "completed": True},
+        {"id": 2, "title": "期限なし"},
+        {"id": 3, "title": "期限あり", "due_date": "2024-01-01"},
+    ]
+    storage_path.write_text(json.dumps(raw), encoding="utf-8")
+    manager = TaskManager(TaskStorage(storage_path))
+    assert [task.id for task in manager.list_tasks()] == [3, 2, 1]
+    assert [task.id for task in manager.list_tasks(status="completed")] == [1]
+
+
+def test_failed_save_keeps_previous_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    storage_path = tmp_path / "tasks.json"
+    manager = TaskManager(TaskStorage(storage_path))
+    manager.add_task(title="元のタスク")
+
+    def failing_replace(src: object, dst: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage_module.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        manager.add_task(title="失敗するタスク")
+    assert [item["title"] for item in read_raw_tasks(storage_path)] == ["元のタスク"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["tasks.json"]
+
+
+def test_list_by_status(manager: TaskManager) -> None:
+    for title in ("A", "B", "C", "D"):
+        manager.add_task(title=title)
+    manager.complete_task(2)
+    manager.complete_task(4)
+    assert [task.title for task in manager.list_tasks(status="pending")] == ["A", "C"]
+    assert [task.title for task in manager.list_tasks(status="completed")] == ["B", "D"]
+    manager.complete_task(1)
+    manager.complete_task(3)
+    assert manager.list_tasks(status="pending") == []
+    assert len(manager.list_tasks(status="completed")) == 4
+
+
+def test_package_exports_are_lazy() -> None:
+    code = (
+        "import sys, task_manager.cli\n"
+        "assert 'task_manager.savings' not in sys.modules\n"
+        "from task_manager import SavingsDietTracker, TaskManager\n"
+        "assert SavingsDietTracker.__module__ == 'task_manager.savings'\n"
+        "assert TaskManager is task_manager.cli.TaskManager\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[1])
+
+
+@pytest.mark.parametrize("fixture_name", ["capsys", "capfd"])
+def test_cli_list_output(
+    tmp_path: Path, request: pytest.FixtureRequest, fixture_name: str
+) -> None:
+    database = str(tmp_path / "tasks.json")
+    assert main(["-d", database, "add", "散歩", "--due-date", "2024-04-01"]) == 0
+    capture = request.getfixturevalue(fixture_name)
+    capture.readouterr()
+    assert main(["-d", database, "list"]) == 0
+    lines = capture.readouterr().out.splitlines()
+    assert lines[0].split(" | ")[:3] == ["ID", "完", "タイトル"]
+    assert lines[2].split(" | ")[2:4] == ["散歩  ", "2024-04-01"]
+
+
+def test_storage_batch_defers_writes(tmp_path: Path) -> None:
+    storage_path = tmp_path / "tasks.json"
+    storage = TaskStorage(storage_path)
+    manager = TaskManager(storage)
+    with storage.batch():
+        first = manager.add_task(title="下書き")
+        with storage.batch():
+            manager.add_task(title="校正")
+        manager.complete_task(first.id)
+        assert not storage_path.exists()
+        assert [task.title for task in manager.list_tasks(status="pending")] == ["校正"]
+    assert [item["title"] for item in read_raw_tasks(storage_path)] == ["校正", "下書き"]
+    assert read_raw_tasks(storage_path)[1]["completed"] is True
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_storage_codecs_agree_on_odd_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(storage_module, "orjson", None)
+    elif storage_module.orjson is None:
+        pytest.skip("orjson is not installed")
+    storage_path = tmp_path / "tasks.json"
+    storage_path.write_text("{}", encoding="utf-8")
+    assert TaskStorage(storage_path).load_tasks() == []
+
+
+def test_failed_batch_flush_is_superseded_by_next_save(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage_path = tmp_path / "tasks.json"
+    storage = TaskStorage(storage_path)
+    manager = TaskManager(storage)
+    manager.add_task(title="A")
+
+    real_replace = storage_module.os.replace
+    calls = []
+
+    def replace_failing_once(src: object, dst: object) -> None:
+        calls.append(src)
+        if len(calls) == 1:
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(storage_module.os, "replace", replace_failing_once)
+    with pytest.raises(OSError):
+        with storage.batch():
+            manager.add_task(title="B")
+    assert [item["title"] for item in read_raw_tasks(storage_path)] == ["A"]
+    assert storage.has_pending
+
+    manager.add_task(title="C")
+    assert not storage.has_pending
+    assert [task.title for task in storage.load_tasks()] == ["A", "B", "C"]
+    TaskManager(storage).add_task(title="D")
+    assert [item["title"] for item in read_raw_tasks(storage_path)] == ["A", "B", "C", "D"]
+
+
+def test_save_uses_unique_temporary_file(tmp_path: Path) -> None:
+    storage_path = tmp_path / "tasks.json"
+    manager = TaskManager(TaskStorage(storage_path))
+    manager.add_task(title="初回")
+    storage_path.chmod(0o640)
+    other_writer_tmp = tmp_path / "tasks.json.tmp"
+    other_writer_tmp.write_text("別プロセスの書き込み中", encoding="utf-8")
+    manager.add_task(title="二回目")
+    assert other_writer_tmp.read_text(encoding="utf-8") == "別プロセスの書き込み中"
+    assert [item["title"] for item in read_raw_tasks(storage_path)] == ["初回", "二回目"]
+    if os.name == "posix":
+        assert storage_path.stat().st_mode & 0o777 == 0o640
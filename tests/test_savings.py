@@ -0,0 +1,133 @@
+"""Tests for the savings x diet tracker."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from task_manager.savings import (
+    CategoryPreset,
+    DailySummary,
+    RestraintRecord,
+    SavingsDietTracker,
+)
+
+
+@pytest.fixture()
+def tracker() -> SavingsDietTracker:
+    return SavingsDietTracker()
+
+
+def test_register_restraint_updates_totals(tracker: SavingsDietTracker) -> None:
+    first = tracker.register_restraint("お菓子")
+    assert (first.saved_amount, first.calories_reduced) == (150.0, 200.0)
+    assert (first.total_saved, first.total_calories) == (150.0, 200.0)
+    second = tracker.register_restraint("スイーツ")
+    assert (second.total_saved, second.total_calories) == (550.0, 550.0)
+    totals = tracker.totals()
+    assert (totals.total_saved, totals.total_calories) == (550.0, 550.0)
+
+
+def test_unknown_category(tracker: SavingsDietTracker) -> None:
+    with pytest.raises(ValueError):
+        tracker.register_restraint("ラーメン")
+    assert tracker.totals().total_saved == 0.0
+
+
+def test_reward_progress(tracker: SavingsDietTracker) -> None:
+    tracker.register_restraint("お菓子")
+    tracker.register_restraint("ジュース")
+    progress = tracker.set_reward_goal("映画", 1000.0)
+    assert progress.current_amount == 270.0
+    assert progress.remaining_amount == 730.0
+    assert progress.estimated_actions == 6
+    assert tracker.reward_progress(reference_category="スイーツ").estimated_actions == 2
+
+
+def test_totals_do_not_accumulate_round_off() -> None:
+    tracker = SavingsDietTracker([CategoryPreset("ガム", 0.1, 0.1)])
+    for _ in range(10):
+        feedback = tracker.register_restraint("ガム")
+    assert feedback.total_saved == 1.0
+    assert tracker.totals().total_calories == 1.0
+
+
+def test_monthly_breakdown(tracker: SavingsDietTracker) -> None:
+    tracker.register_restraint("お菓子", when="2024-02-29T23:30:00")
+    tracker.register_restraint("ジュース", when="2024-03-01T08:00:00+09:00")
+    tracker.register_restraint("スイーツ", when=date(2024, 2, 1))
+    tracker.register_restraint("ジュース", when="2024-02-29")
+    tracker.register_restraint("お菓子", when="2024-03-02")
+    assert tracker.monthly_breakdown(2024, 2) == [
+        DailySummary(date(2024, 2, 1), 400.0, 350.0),
+        DailySummary(date(2024, 2, 29), 390.0, 500.0),
+    ]
+    assert tracker.monthly_breakdown(2024, 4) == []
+    with pytest.raises(ValueError):
+        tracker.monthly_breakdown(2024, 13)
+
+
+def test_estimated_actions_at_exact_multiple() -> None:
+    tracker = SavingsDietTracker([CategoryPreset("飴", 0.01, 1.0)])
+    progress = tracker.set_reward_goal("貯金箱", 0.07, reference_category="飴")
+    assert progress.estimated_actions == 7
+    for _ in range(7):
+        tracker.register_restraint("飴")
+    assert tracker.reward_progress().estimated_actions == 0
+
+
+def test_register_restraint_bulk(tracker: SavingsDietTracker) -> None:
+    tracker.register_restraint("ジュース")
+    feedback = tracker.register_restraint_bulk(
+        ["お菓子", "スイーツ"], whens=["2024-05-01", date(2024, 5, 3)]
+    )
+    assert (feedback.saved_amount, feedback.calories_reduced) == (550.0, 550.0)
+    assert (feedback.total_saved, feedback.total_calories) == (670.0, 700.0)
+    assert [summary.date.day for summary in tracker.monthly_breakdown(2024, 5)] == [1, 3]
+
+
+def test_register_restraint_bulk_is_all_or_nothing(tracker: SavingsDietTracker) -> None:
+    with pytest.raises(ValueError):
+        tracker.register_restraint_bulk(["お菓子", "ラーメン"])
+    with pytest.raises(ValueError):
+        tracker.register_restraint_bulk(["お菓子", "ジュース"], whens=["2024-05-01", "昨日"])
+    with pytest.raises(ValueError):
+        tracker.register_restraint_bulk(["お菓子"], whens=[])
+    assert tracker.totals().total_saved == 0.0
+
+
+def test_categories_is_read_only_view(tracker: SavingsDietTracker) -> None:
+    categories = tracker.categories
+    assert list(categories) == ["お菓子", "ジュース", "スイーツ"]
+    with pytest.raises(TypeError):
+        categories["ラーメン"] = CategoryPreset("ラーメン", 900.0, 500.0)  # type: ignore[index]
+    tracker.add_category(CategoryPreset("ラーメン", 900.0, 500.0))
+    assert categories["ラーメン"].price == 900.0
+
+
+def test_estimated_actions_from_average_at_exact_multiple(tracker: SavingsDietTracker) -> None:
+    for name in ("お菓子", "ジュース", "スイーツ"):
+        tracker.register_restraint(name)
+    progress = tracker.set_reward_goal("旅行", 1340.0)
+    assert progress.remaining_amount == 670.0
+    assert progress.estimated_actions == 3
+
+
+def test_estimated_actions_with_sub_sen_price() -> None:
+    tracker = SavingsDietTracker([CategoryPreset("水", 0.004, 0.0)])
+    progress = tracker.set_reward_goal("貯金", 0.01, reference_category="水")
+    assert progress.estimated_actions == 3
+
+
+def test_restraint_record_derives_utc_date() -> None:
+    preset = CategoryPreset("お菓子", 150.0, 200.0)
+    when = datetime(2024, 3, 1, 8, 0, tzinfo=timezone(timedelta(hours=9)))
+    record = RestraintRecord(category=preset, timestamp=when)
+    assert record.utc_date == date(2024, 2, 29)
+
+
+def test_estimated_actions_just_above_integer_round_up() -> None:
+    tracker = SavingsDietTracker([CategoryPreset("お菓子", 150.0, 200.0)])
+    progress = tracker.set_reward_goal("車", 150_000_000.1, reference_category="お菓子")
+    assert progress.estimated_actions == 1_000_001